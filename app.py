@@ -3,129 +3,352 @@
 FAQ Scraper Web UI - Flask application with optimized crawling
 """
 
-import json
+import asyncio
+import multiprocessing
+import os
 import re
+import string
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
+from functools import lru_cache
 from urllib.parse import urljoin, urlparse
-from typing import Set, List, Dict, Optional, Tuple
+from typing import Set, FrozenSet, List, Dict, Optional, Tuple
 
+import aiohttp
+import diskcache
+import orjson
 import requests
+import xxhash
 from flask import Flask, render_template, request, jsonify
-from bs4 import BeautifulSoup
+from flask.json.provider import JSONProvider
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser, LexborNode
+from urllib3.util.retry import Retry
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
 
-class FAQScraper:
-    def __init__(self, website_url: str, max_pages: int = 100, timeout: int = 30000):
-        self.base_url = website_url.rstrip("/")
-        self.domain = urlparse(self.base_url).netloc
-        self.max_pages = max_pages
-        self.timeout = timeout
-        self.visited_urls: Set[str] = set()
-        self.all_faqs: List[Dict] = []
-        self.seen_questions: Set[str] = set()
-        self.faq_page_found = False
+# Max number of in-flight page fetches during the async crawl
+DEFAULT_CONCURRENCY = 20
 
-    def _is_valid_internal_url(self, url: str) -> bool:
-        """Check if URL is internal and valid for crawling."""
-        if not url:
-            return False
-        
-        parsed = urlparse(url)
-        
-        if parsed.scheme and parsed.scheme not in ["http", "https"]:
-            return False
-        
-        skip_patterns = [
-            r"utm_", r"fbclid", r"gclid", r"#", r"javascript:",
-            r"mailto:", r"tel:", r"\.pdf$", r"\.jpg$", r"\.png$",
-            r"\.gif$", r"\.svg$", r"\.css$", r"\.js$", r"\.zip$",
-            r"\.mp4$", r"\.mp3$", r"\.doc$", r"\.xls$"
-        ]
-        for pattern in skip_patterns:
-            if re.search(pattern, url, re.IGNORECASE):
-                return False
-        
-        if parsed.netloc and parsed.netloc != self.domain:
+# Minimum gap between two requests to the same host, to avoid 429s and bot blocks
+DEFAULT_DOMAIN_DELAY_MS = 200
+
+# Pages with less visible text than this are treated as JS-rendered shells
+MIN_STATIC_TEXT_LENGTH = 100
+
+# Markers of client-side rendered apps (Next.js, Nuxt, Apollo, AngularJS, empty React/Vue mount)
+JS_APP_RE = re.compile(
+    r'__NEXT_DATA__|window\.__NUXT__|window\.__APOLLO_STATE__|\bng-app\b|'
+    r'id=["\'](?:root|app|__next)["\'][^>]*>\s*</',
+    re.IGNORECASE
+)
+
+# Page bodies are read in chunks and cut off at this size
+MAX_BODY_BYTES = 2_000_000
+BODY_CHUNK_SIZE = 64 * 1024
+
+# Fetched pages and their validators persist here between runs, shared by all scrapes
+CACHE_DIR = '.scrape_cache'
+_page_cache: Optional[diskcache.Cache] = None
+
+# Page extraction is CPU-bound, so it runs on a process pool shared by all scrapes
+_process_pool: Optional[ProcessPoolExecutor] = None
+
+# Nav and footer links repeat on every page, so URL checks are memoized
+URL_CACHE_SIZE = 8192
+FAQ_LINK_CACHE_SIZE = 4096
+
+
+# URLs that are tracking links, non-HTTP schemes, or binary assets
+SKIP_URL_RE = re.compile(
+    r"utm_|fbclid|gclid|#|javascript:|mailto:|tel:|\.pdf$|\.jpg$|\.png$|"
+    r"\.gif$|\.svg$|\.css$|\.js$|\.zip$|\.mp4$|\.mp3$|\.doc$|\.xls$",
+    re.IGNORECASE
+)
+
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Trailing boilerplate stripped from extracted text, as one alternation so text is scanned once
+NOISE_RE = re.compile(
+    r'(?:(?:Subscribe Newsletter|Sign up to get|©\s*\d{4}|All Rights Reserved|Privacy Policy.*?Terms).*|To Top)$',
+    re.IGNORECASE | re.DOTALL
+)
+
+# Bullets and markers trimmed from the ends of extracted text, along with spaces
+TEXT_STRIP_CHARS = ' •·-–—*#'
+
+STRING_PREFIX_RE = re.compile(r'^[bB]?[\"\']?')
+LEADING_NUMBER_RE = re.compile(r'^\d+[\)\.\:\s]*(?=[A-Za-z])')
+NUMBERED_HEADING_RE = re.compile(r'^\d+\.\s*')
+
+QUESTION_START_RE = re.compile(r'(?:can|do|does|is|are|how|what|why|when|where|will|should) ', re.IGNORECASE)
+
+# Markdown-style "FAQ Question 1. ... FAQ Answer 1. ..." blocks
+FAQ_QUESTION_RE = re.compile(r'FAQ\s*Question\s*\d*\.?\s*([^\n]+?)(?:\n|FAQ\s*Answer)', re.IGNORECASE)
+FAQ_ANSWER_RE = re.compile(r'FAQ\s*Answer\s*\d*\.?\s*([^#]+?)(?=FAQ\s*Question|\Z|####)', re.IGNORECASE | re.DOTALL)
+
+# Deleting these bytes from ASCII-encoded text leaves only the letters
+ASCII_NON_LETTERS = bytes(b for b in range(128) if not chr(b).isalpha())
+
+# Punctuation is ignored when deciding whether two questions are the same
+QUESTION_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation)
+
+# Non-content elements dropped right after parsing, matched in a single lexbor pass.
+# JSON-LD is kept for _extract_schema_faqs, which removes it once read.
+NON_CONTENT_SELECTOR = 'script:not([type="application/ld+json"]), style, noscript, iframe'
+
+# Everything that never renders as text, JSON-LD included, for measuring visible text
+INVISIBLE_SELECTOR = 'script, style, noscript, iframe'
+
+# Site chrome pruned before FAQ detection; its links are collected first
+PAGE_CHROME_SELECTOR = ':is(nav, aside, header, footer, [role="navigation"], [role="banner"], [role="contentinfo"])'
+
+# Headers and footers under these belong to the content (e.g. accordion items) and are kept
+SECTIONING_TAGS = frozenset({'article', 'section', 'main'})
+
+HEADING_TAGS = ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']
+
+FAQ_HEADING_PATTERNS = [
+    'faq', 'faqs', 'f.a.q', 'f.a.q.s',
+    'frequently asked questions', 'frequently asked',
+    'common questions', 'questions & answers', 'questions and answers',
+    'q&a', 'q & a', 'have questions', 'got questions'
+]
+
+
+def _keyword_re(patterns: List[str]) -> re.Pattern:
+    """Compile literal keywords into one case-insensitive alternation."""
+    return re.compile('|'.join(re.escape(pattern) for pattern in patterns), re.IGNORECASE)
+
+
+FAQ_HEADING_RE = _keyword_re(FAQ_HEADING_PATTERNS)
+
+# FAQ links are detected by URL path OR link text
+FAQ_URL_RE = _keyword_re([
+    '/faq', '/faqs', '/frequently-asked', '/help/faq', '/support/faq',
+    'faq.', '/questions', '/q-and-a', '/qa'
+])
+FAQ_LINK_TEXT_RE = _keyword_re(['faq', 'frequently asked', 'questions', 'q&a', 'help center'])
+
+# Account/marketing prompts that look like questions but are not FAQs
+SKIP_QUESTION_RE = _keyword_re([
+    'forgot your password', 'reset password', 'sign in', 'log in',
+    'create account', 'register', 'subscribe', 'newsletter',
+    'contact us', 'get in touch'
+])
+
+
+def _attr_contains_selector(tags: List[str], attrs: List[str], patterns: List[str]) -> str:
+    """Build a CSS selector for tags where any of attrs contains any pattern (case-insensitive)."""
+    attr_matchers = ', '.join(f'[{attr}*="{pattern}" i]' for attr in attrs for pattern in patterns)
+    return f":is({', '.join(tags)}):is({attr_matchers})" if tags else f":is({attr_matchers})"
+
+
+# Selectors for FAQ headings/containers and the Q&A parts inside them
+FAQ_SECTION_SELECTOR = ', '.join(HEADING_TAGS + [
+    _attr_contains_selector(['section', 'div', 'article'], ['class', 'id'], FAQ_HEADING_PATTERNS)
+])
+QA_CONTAINER_SELECTOR = _attr_contains_selector(['div', 'li', 'article'], ['class'], ['faq', 'question', 'qa-', 'accordion-item'])
+QA_QUESTION_SELECTOR = _attr_contains_selector([], ['class'], ['question', 'title', 'header', 'trigger'])
+QA_ANSWER_SELECTOR = _attr_contains_selector([], ['class'], ['answer', 'content', 'body', 'panel'])
+
+
+def _find_all(node: LexborNode, selector: str) -> List[LexborNode]:
+    """Return descendants of node matching selector, excluding node itself."""
+    return [match for match in node.css(selector) if match.mem_id != node.mem_id]
+
+
+def _find(node: LexborNode, selector: str) -> Optional[LexborNode]:
+    """Return the first descendant of node matching selector."""
+    matches = _find_all(node, selector)
+    return matches[0] if matches else None
+
+
+def _next_element(node: LexborNode) -> Optional[LexborNode]:
+    """Return the next sibling element, skipping text and comment nodes."""
+    node = node.next
+    while node is not None and not node.is_element_node:
+        node = node.next
+    return node
+
+
+def _looks_like_question(text: str) -> bool:
+    """Check if text ends with '?' or starts with a question word."""
+    return text.endswith('?') or QUESTION_START_RE.match(text) is not None
+
+
+def _in_sectioning_content(node: LexborNode) -> bool:
+    """Check if a node has an article, section or main ancestor."""
+    parent = node.parent
+    while parent is not None:
+        if parent.tag in SECTIONING_TAGS:
+            return True
+        parent = parent.parent
+    return False
+
+
+def _schema_hash(raw: str) -> int:
+    """Hash a JSON-LD block the same way in every worker process."""
+    return xxhash.xxh64_intdigest(raw.encode())
+
+
+def _question_key(q_normalized: str) -> int:
+    """Hash a lowercased question for deduplication, ignoring punctuation."""
+    return xxhash.xxh64_intdigest(q_normalized.translate(QUESTION_PUNCTUATION_TABLE).encode())
+
+
+def _is_acceptable_page(headers) -> bool:
+    """Check response headers for an HTML body that is not over the size cap."""
+    content_type = headers.get('Content-Type', '')
+    if content_type and 'html' not in content_type.lower():
+        return False
+    content_length = headers.get('Content-Length', '')
+    if content_length.isdigit() and int(content_length) > MAX_BODY_BYTES:
+        return False
+    return True
+
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """Decode a page body, falling back to UTF-8 for missing or unknown charsets."""
+    try:
+        return body.decode(encoding or 'utf-8', errors='replace')
+    except LookupError:
+        return body.decode('utf-8', errors='replace')
+
+
+@lru_cache(maxsize=FAQ_LINK_CACHE_SIZE)
+def _is_faq_link(url: str, link_text: str) -> bool:
+    """Check if link is FAQ-related by URL path OR link text."""
+    return bool(FAQ_URL_RE.search(url) or FAQ_LINK_TEXT_RE.search(link_text))
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _is_valid_internal_url(url: str, domain: str) -> bool:
+    """Check if URL is internal and valid for crawling."""
+    if not url:
+        return False
+    
+    parsed = urlparse(url)
+    
+    if parsed.scheme and parsed.scheme not in ["http", "https"]:
+        return False
+    
+    if SKIP_URL_RE.search(url):
+        return False
+    
+    if parsed.netloc and parsed.netloc != domain:
+        return False
+    
+    # Limit to 1 level depth (e.g., /path is ok, /path/subpath is not)
+    path = parsed.path.strip('/')
+    if path:
+        path_parts = path.split('/')
+        if len(path_parts) > 1:
             return False
+    
+    return True
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _normalize_url(url: str, base_url: str) -> str:
+    """Normalize URL for deduplication."""
+    if not url.startswith(("http://", "https://")):
+        url = urljoin(base_url, url)
+    
+    parsed = urlparse(url)
+    path = parsed.path.rstrip("/") or "/"
+    return f"{parsed.scheme}://{parsed.netloc}{path}"
+
+
+class DomainLimiter:
+    """Space out requests to the same host by a minimum delay."""
+
+    def __init__(self, delay_ms: int = DEFAULT_DOMAIN_DELAY_MS):
+        self.delay = delay_ms / 1000
+        self.last_hit: Dict[str, float] = {}
+
+    async def wait(self, host: str):
+        """Sleep until the next request slot for host is due."""
+        now = asyncio.get_running_loop().time()
+        # Reserve the slot before sleeping so concurrent callers queue up behind it
+        slot = max(now, self.last_hit.get(host, now - self.delay) + self.delay)
+        self.last_hit[host] = slot
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+class FAQExtractor:
+    """Extract FAQs and internal links from a single page.
+
+    Holds no crawl state, so pages can be processed in worker processes.
+    """
+
+    def __init__(self, base_url: str, domain: str, seen_schema_hashes: FrozenSet[int] = frozenset()):
+        self.base_url = base_url
+        self.domain = domain
+        self.faqs: List[Dict] = []
+        self.seen_hashes: Set[int] = set()
+        self.seen_schema_hashes: Set[int] = set(seen_schema_hashes)
+
+    def extract(self, html: str, url: str) -> List[Tuple[str, str]]:
+        """Parse a page, collect its FAQs into self.faqs, and return its links with text."""
+        tree = LexborHTMLParser(html)
         
-        # Limit to 1 level depth (e.g., /path is ok, /path/subpath is not)
-        path = parsed.path.strip('/')
-        if path:
-            path_parts = path.split('/')
-            if len(path_parts) > 1:
-                return False
+        for element in tree.css(NON_CONTENT_SELECTOR):
+            element.decompose()
         
-        return True
-
-    def _normalize_url(self, url: str) -> str:
-        """Normalize URL for deduplication."""
-        if not url.startswith(("http://", "https://")):
-            url = urljoin(self.base_url, url)
+        links = self._extract_links_with_text(tree)
+        self._extract_faqs_from_page(tree, html, url)
         
-        parsed = urlparse(url)
-        path = parsed.path.rstrip("/") or "/"
-        return f"{parsed.scheme}://{parsed.netloc}{path}"
+        return links
 
-    def _extract_links_with_text(self, soup: BeautifulSoup) -> List[Tuple[str, str]]:
+    def _extract_links_with_text(self, tree: LexborHTMLParser) -> List[Tuple[str, str]]:
         """Extract all valid internal links with their text from page."""
-        links = []
-        for a_tag in soup.find_all("a", href=True):
-            href = a_tag["href"]
-            link_text = a_tag.get_text(strip=True).lower()
-            full_url = self._normalize_url(href)
-            if self._is_valid_internal_url(full_url) and full_url not in self.visited_urls:
-                links.append((full_url, link_text))
-        # Deduplicate by URL
         seen = set()
         unique_links = []
-        for url, text in links:
-            if url not in seen:
-                seen.add(url)
-                unique_links.append((url, text))
+        for a_tag in tree.css("a[href]"):
+            href = a_tag.attributes.get("href") or ""
+            full_url = _normalize_url(href, self.base_url)
+            # Deduplicate by URL before doing any further work on the link
+            if full_url in seen:
+                continue
+            if not _is_valid_internal_url(full_url, self.domain):
+                continue
+            seen.add(full_url)
+            unique_links.append((full_url, a_tag.text(strip=True).lower()))
         return unique_links
 
-    def _is_faq_link(self, url: str, link_text: str) -> bool:
-        """Check if link is FAQ-related by URL path OR link text."""
-        url_lower = url.lower()
-        text_lower = link_text.lower()
-        
-        # Check URL patterns
-        url_patterns = ['/faq', '/faqs', '/frequently-asked', '/help/faq', '/support/faq', 
-                        'faq.', '/questions', '/q-and-a', '/qa']
-        
-        # Check link text patterns
-        text_patterns = ['faq', 'frequently asked', 'questions', 'q&a', 'help center']
-        
-        return (any(pattern in url_lower for pattern in url_patterns) or
-                any(pattern in text_lower for pattern in text_patterns))
-
     def _normalize_text(self, text: str) -> str:
         """Clean and normalize text."""
         if not text:
             return ""
-        text = re.sub(r'\s+', ' ', text).strip()
-        text = text.strip('•·-–—*#')
-        noise_patterns = [
-            r'Subscribe Newsletter.*$',
-            r'Sign up to get.*$',
-            r'© \d{4}.*$',
-            r'All Rights Reserved.*$',
-            r'Privacy Policy.*Terms.*$',
-            r'To Top$'
-        ]
-        for pattern in noise_patterns:
-            text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-        return text.strip()
+        text = WHITESPACE_RE.sub(' ', text).strip(TEXT_STRIP_CHARS)
+        return NOISE_RE.sub('', text).strip()
 
     def _is_english(self, text: str) -> bool:
         """Check if text is primarily English."""
         if not text:
             return False
-        # Count ASCII letters vs non-ASCII characters
-        ascii_letters = sum(1 for c in text if c.isascii() and c.isalpha())
-        non_ascii = sum(1 for c in text if not c.isascii())
+        # Count ASCII letters vs non-ASCII characters (at C speed, no per-char loop)
+        ascii_bytes = text.encode('ascii', 'ignore')
+        non_ascii = len(text) - len(ascii_bytes)
+        ascii_letters = len(ascii_bytes.translate(None, ASCII_NON_LETTERS))
         total_letters = ascii_letters + non_ascii
         if total_letters == 0:
             return True
@@ -142,22 +365,21 @@ class FAQScraper:
         
         # Remove leading numbers like "1)", "2.", "1What", "11What", "2 What" etc.
         # Also handle string prefixes like b"..." that may appear in scraped content
-        question = re.sub(r'^[bB]?[\"\']?', '', question).strip()  # Remove string prefixes
-        question = re.sub(r'^\d+[\)\.\:\s]*(?=[A-Za-z])', '', question).strip()
+        question = STRING_PREFIX_RE.sub('', question).strip()  # Remove string prefixes
+        question = LEADING_NUMBER_RE.sub('', question).strip()
         q_normalized = question.lower().strip()
         
         
-        skip_patterns = [
-            'forgot your password', 'reset password', 'sign in', 'log in',
-            'create account', 'register', 'subscribe', 'newsletter',
-            'contact us', 'get in touch'
-        ]
-        if any(pattern in q_normalized for pattern in skip_patterns):
+        if SKIP_QUESTION_RE.search(q_normalized):
+            return
+        
+        if not q_normalized or len(question) <= 5:
             return
         
-        if q_normalized and q_normalized not in self.seen_questions and len(question) > 5:
-            self.seen_questions.add(q_normalized)
-            self.all_faqs.append({
+        question_hash = _question_key(q_normalized)
+        if question_hash not in self.seen_hashes:
+            self.seen_hashes.add(question_hash)
+            self.faqs.append({
                 "question": question,
                 "answer": answer,
                 "sourceUrl": source_url
@@ -165,36 +387,41 @@ class FAQScraper:
 
     def _is_faq_heading(self, text: str) -> bool:
         """Check if text is a FAQ-related heading."""
-        text_lower = text.lower().strip()
-        faq_heading_patterns = [
-            'faq', 'faqs', 'f.a.q', 'f.a.q.s',
-            'frequently asked questions', 'frequently asked',
-            'common questions', 'questions & answers', 'questions and answers',
-            'q&a', 'q & a', 'have questions', 'got questions'
-        ]
-        return any(pattern in text_lower for pattern in faq_heading_patterns)
-
-    def _find_faq_sections(self, soup: BeautifulSoup) -> List:
+        return FAQ_HEADING_RE.search(text) is not None
+
+    def _find_faq_sections(self, tree: LexborHTMLParser) -> List:
         """Find all FAQ sections in the page (elements under FAQ headings)."""
         faq_sections = []
+        faq_by_class = []
+        faq_by_id = []
         
-        # Find headings that indicate FAQ sections
-        for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6']):
-            heading_text = heading.get_text(strip=True)
+        # One sweep finds both headings and FAQ-classed/ID'd containers
+        for node in tree.css(FAQ_SECTION_SELECTOR):
+            if node.tag not in HEADING_TAGS:
+                # Containers keep their original order: class matches, then ID matches
+                if self._is_faq_heading(node.attributes.get('class') or ''):
+                    faq_by_class.append(node)
+                if self._is_faq_heading(node.attributes.get('id') or ''):
+                    faq_by_id.append(node)
+                continue
+            
+            # Find headings that indicate FAQ sections
+            heading = node
+            heading_text = heading.text(strip=True)
             if self._is_faq_heading(heading_text):
                 # Collect all content until next same-level or higher heading
                 section_content = []
-                current = heading.find_next_sibling()
-                heading_level = int(heading.name[1])  # h1 -> 1, h2 -> 2, etc.
+                current = _next_element(heading)
+                heading_level = int(heading.tag[1])  # h1 -> 1, h2 -> 2, etc.
                 
-                while current:
+                while current is not None:
                     # Stop if we hit another heading of same or higher level
-                    if current.name and current.name in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                        current_level = int(current.name[1])
+                    if current.tag in HEADING_TAGS:
+                        current_level = int(current.tag[1])
                         if current_level <= heading_level:
                             break
                     section_content.append(current)
-                    current = current.find_next_sibling()
+                    current = _next_element(current)
                 
                 if section_content:
                     faq_sections.append({
@@ -202,39 +429,28 @@ class FAQScraper:
                         'content': section_content
                     })
         
-        # Also find sections/divs with FAQ-related classes or IDs
-        faq_containers = soup.find_all(
-            ['section', 'div', 'article'],
-            class_=lambda x: x and self._is_faq_heading(' '.join(x) if isinstance(x, list) else x)
-        )
-        for container in faq_containers:
-            if container not in [s.get('heading') for s in faq_sections]:
-                faq_sections.append({
-                    'heading': None,
-                    'content': [container]
-                })
-        
-        # Check for ID-based FAQ sections
-        faq_by_id = soup.find_all(
-            ['section', 'div', 'article'],
-            id=lambda x: x and self._is_faq_heading(x)
-        )
-        for container in faq_by_id:
-            if container not in [s.get('heading') for s in faq_sections]:
-                faq_sections.append({
-                    'heading': None,
-                    'content': [container]
-                })
+        # Also add sections/divs with FAQ-related classes or IDs
+        for container in faq_by_class + faq_by_id:
+            faq_sections.append({
+                'heading': None,
+                'content': [container]
+            })
         
         return faq_sections
 
-    def _extract_faqs_from_page(self, soup: BeautifulSoup, html: str, url: str):
+    def _extract_faqs_from_page(self, tree: LexborHTMLParser, html: str, url: str):
         """Extract FAQs ONLY from sections with FAQ headings."""
         # Always check for schema FAQs (they are explicitly marked as FAQ)
-        self._extract_schema_faqs(soup, url)
+        self._extract_schema_faqs(tree, url)
+        
+        # Nav, header and footer hold "Help" links and "Questions?" headings, never real FAQs
+        for element in tree.css(PAGE_CHROME_SELECTOR):
+            if element.tag in ('header', 'footer') and _in_sectioning_content(element):
+                continue
+            element.decompose()
         
         # Find FAQ sections in the page
-        faq_sections = self._find_faq_sections(soup)
+        faq_sections = self._find_faq_sections(tree)
         
         if not faq_sections:
             # No FAQ sections found, skip extraction
@@ -248,12 +464,11 @@ class FAQScraper:
             # Collect all paragraphs from the section
             all_paragraphs = []
             for elem in content_elements:
-                if hasattr(elem, 'name'):
-                    if elem.name == 'p':
-                        all_paragraphs.append(elem)
-                    else:
-                        # Also extract from nested elements
-                        self._extract_from_faq_element(elem, url)
+                if elem.tag == 'p':
+                    all_paragraphs.append(elem)
+                else:
+                    # Also extract from nested elements
+                    self._extract_from_faq_element(elem, url)
             
             # Process collected paragraphs as Q&A pairs
             if all_paragraphs:
@@ -261,19 +476,21 @@ class FAQScraper:
 
     def _extract_from_paragraph_list(self, paragraphs: List, url: str):
         """Extract Q&A from a list of paragraph elements."""
+        # Extract each paragraph's text once; the scan below revisits them
+        texts = [p.text(strip=True) for p in paragraphs]
         i = 0
-        while i < len(paragraphs):
-            p_text = paragraphs[i].get_text(strip=True)
+        while i < len(texts):
+            p_text = texts[i]
             # Check if this paragraph looks like a question
-            if p_text.endswith('?') or p_text.lower().startswith(('can ', 'do ', 'does ', 'is ', 'are ', 'how ', 'what ', 'why ', 'when ', 'where ', 'will ', 'should ')):
+            if _looks_like_question(p_text):
                 question = self._normalize_text(p_text)
                 # Next paragraph(s) are the answer
                 answer_parts = []
                 j = i + 1
-                while j < len(paragraphs):
-                    next_text = paragraphs[j].get_text(strip=True)
+                while j < len(texts):
+                    next_text = texts[j]
                     # Stop if we hit another question
-                    if next_text.endswith('?') or next_text.lower().startswith(('can ', 'do ', 'does ', 'is ', 'are ', 'how ', 'what ', 'why ', 'when ', 'where ', 'will ', 'should ')):
+                    if _looks_like_question(next_text):
                         break
                     answer_parts.append(next_text)
                     j += 1
@@ -285,11 +502,18 @@ class FAQScraper:
             else:
                 i += 1
 
-    def _extract_schema_faqs(self, soup: BeautifulSoup, url: str):
+    def _extract_schema_faqs(self, tree: LexborHTMLParser, url: str):
         """Extract FAQs from JSON-LD schema markup (always valid as explicitly marked)."""
-        for script in soup.find_all('script', type='application/ld+json'):
+        for script in tree.css('script[type="application/ld+json"]'):
+            raw = script.text()
+            script.decompose()
+            # Site-wide schema blocks repeat on every page, so parse each one only once
+            schema_hash = _schema_hash(raw)
+            if schema_hash in self.seen_schema_hashes:
+                continue
+            self.seen_schema_hashes.add(schema_hash)
             try:
-                data = json.loads(script.string)
+                data = orjson.loads(raw)
                 if isinstance(data, dict):
                     if data.get('@type') == 'FAQPage':
                         for item in data.get('mainEntity', []):
@@ -304,77 +528,66 @@ class FAQScraper:
     def _extract_from_faq_element(self, elem, url: str):
         """Extract FAQs from an element that is within a FAQ section."""
         # Pattern 1: details/summary (accordion)
-        for details in elem.find_all('details'):
-            summary = details.find('summary')
-            if summary:
-                question = self._normalize_text(summary.get_text(strip=True))
+        for details in _find_all(elem, 'details'):
+            summary = _find(details, 'summary')
+            if summary is not None:
+                question = self._normalize_text(summary.text(strip=True))
                 answer_parts = []
-                for child in details.children:
-                    if child != summary and hasattr(child, 'get_text'):
-                        answer_parts.append(child.get_text(strip=True))
+                for child in details.iter(include_text=True):
+                    if child.mem_id != summary.mem_id and not child.is_comment_node:
+                        answer_parts.append(child.text(strip=True))
                 answer = self._normalize_text(' '.join(answer_parts))
                 if question and answer:
                     self._add_faq(question, answer, url)
         
         # Pattern 2: Class-based Q&A containers
-        qa_containers = elem.find_all(
-            ['div', 'li', 'article'],
-            class_=lambda x: x and any(p in str(x).lower() for p in ['faq', 'question', 'qa-', 'accordion-item'])
-        )
-        for container in qa_containers:
-            q_elem = container.find(
-                class_=lambda x: x and any(p in str(x).lower() for p in ['question', 'title', 'header', 'trigger'])
-            )
-            a_elem = container.find(
-                class_=lambda x: x and any(p in str(x).lower() for p in ['answer', 'content', 'body', 'panel'])
-            )
-            if q_elem and a_elem:
-                question = self._normalize_text(q_elem.get_text(strip=True))
-                answer = self._normalize_text(a_elem.get_text(strip=True))
+        for container in _find_all(elem, QA_CONTAINER_SELECTOR):
+            q_elem = _find(container, QA_QUESTION_SELECTOR)
+            a_elem = _find(container, QA_ANSWER_SELECTOR)
+            if q_elem is not None and a_elem is not None:
+                question = self._normalize_text(q_elem.text(strip=True))
+                answer = self._normalize_text(a_elem.text(strip=True))
                 if question and answer:
                     self._add_faq(question, answer, url)
         
         # Pattern 3: Heading + paragraph/div patterns
-        for heading in elem.find_all(['h3', 'h4', 'h5', 'h6']):
-            heading_text = heading.get_text(strip=True)
+        for heading in _find_all(elem, 'h3, h4, h5, h6'):
+            heading_text = heading.text(strip=True)
             # Skip if this is another FAQ section heading
             if self._is_faq_heading(heading_text):
                 continue
             
-            next_elem = heading.find_next_sibling()
+            next_elem = _next_element(heading)
             answer_parts = []
-            while next_elem and next_elem.name not in ['h1', 'h2', 'h3', 'h4', 'h5', 'h6']:
-                if next_elem.name in ['p', 'div']:
-                    text = next_elem.get_text(strip=True)
+            while next_elem is not None and next_elem.tag not in HEADING_TAGS:
+                if next_elem.tag in ['p', 'div']:
+                    text = next_elem.text(strip=True)
                     if text:
                         answer_parts.append(text)
-                next_elem = next_elem.find_next_sibling()
+                next_elem = _next_element(next_elem)
             
             answer = self._normalize_text(' '.join(answer_parts))
             question = self._normalize_text(heading_text)
-            question = re.sub(r'^\d+\.\s*', '', question)  # Remove leading numbers
+            question = NUMBERED_HEADING_RE.sub('', question)  # Remove leading numbers
             
             if question and answer and len(answer) > 20:
                 self._add_faq(question, answer, url)
         
         # Pattern 4: Definition lists (dt/dd)
-        for dl in elem.find_all('dl'):
-            dts = dl.find_all('dt')
-            dds = dl.find_all('dd')
+        for dl in _find_all(elem, 'dl'):
+            dts = _find_all(dl, 'dt')
+            dds = _find_all(dl, 'dd')
             for i, dt in enumerate(dts):
-                question = self._normalize_text(dt.get_text(strip=True))
+                question = self._normalize_text(dt.text(strip=True))
                 if i < len(dds):
-                    answer = self._normalize_text(dds[i].get_text(strip=True))
+                    answer = self._normalize_text(dds[i].text(strip=True))
                     if question and answer:
                         self._add_faq(question, answer, url)
         
         # Pattern 5: Markdown-style FAQ patterns in text
-        text = elem.get_text()
-        pattern = r'FAQ\s*Question\s*\d*\.?\s*([^\n]+?)(?:\n|FAQ\s*Answer)'
-        answer_pattern = r'FAQ\s*Answer\s*\d*\.?\s*([^#]+?)(?=FAQ\s*Question|\Z|####)'
-        
-        questions = re.findall(pattern, text, re.IGNORECASE)
-        answers = re.findall(answer_pattern, text, re.IGNORECASE | re.DOTALL)
+        text = elem.text()
+        questions = FAQ_QUESTION_RE.findall(text)
+        answers = FAQ_ANSWER_RE.findall(text)
         
         for i, q in enumerate(questions):
             q_clean = self._normalize_text(q)
@@ -384,57 +597,202 @@ class FAQScraper:
                     self._add_faq(q_clean, a_clean, url)
         
         # Pattern 6: Paragraph-based Q&A (question paragraph ending with ?, followed by answer paragraph)
-        paragraphs = elem.find_all('p')
-        i = 0
-        while i < len(paragraphs) - 1:
-            p_text = paragraphs[i].get_text(strip=True)
-            # Check if this paragraph looks like a question (ends with ? or starts with question words)
-            if p_text.endswith('?') or p_text.lower().startswith(('can ', 'do ', 'does ', 'is ', 'are ', 'how ', 'what ', 'why ', 'when ', 'where ', 'will ', 'should ')):
-                question = self._normalize_text(p_text)
-                # Next paragraph(s) are the answer
-                answer_parts = []
-                j = i + 1
-                while j < len(paragraphs):
-                    next_text = paragraphs[j].get_text(strip=True)
-                    # Stop if we hit another question
-                    if next_text.endswith('?') or next_text.lower().startswith(('can ', 'do ', 'does ', 'is ', 'are ', 'how ', 'what ', 'why ', 'when ', 'where ', 'will ', 'should ')):
-                        break
-                    answer_parts.append(next_text)
-                    j += 1
-                
-                answer = self._normalize_text(' '.join(answer_parts))
-                if question and answer and len(answer) > 20:
-                    self._add_faq(question, answer, url)
-                i = j  # Skip to the next question
-            else:
-                i += 1
+        self._extract_from_paragraph_list(_find_all(elem, 'p'), url)
+
+
+def extract_page(html: str, url: str, base_url: str, domain: str,
+                 seen_schema_hashes: FrozenSet[int] = frozenset()) -> Tuple[List[Dict], List[Tuple[str, str]], Set[int]]:
+    """Extract a page's FAQs, its links with text, and the JSON-LD block hashes it parsed.
+
+    Depends only on its arguments, so it can run in a worker process.
+    """
+    extractor = FAQExtractor(base_url, domain, seen_schema_hashes)
+    links = extractor.extract(html, url)
+    return extractor.faqs, links, extractor.seen_schema_hashes - seen_schema_hashes
+
+
+def _get_page_cache() -> diskcache.Cache:
+    """Return the shared on-disk page cache, opening it on first use."""
+    global _page_cache
+    if _page_cache is None:
+        _page_cache = diskcache.Cache(CACHE_DIR)
+    return _page_cache
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared extraction process pool, creating it on first use."""
+    global _process_pool
+    if _process_pool is None:
+        # Spawned workers, because forking a threaded server process is unsafe
+        _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=multiprocessing.get_context('spawn'))
+    return _process_pool
+
+
+def _reset_process_pool(broken_pool: ProcessPoolExecutor):
+    """Drop a broken process pool so the next extraction starts a fresh one."""
+    global _process_pool
+    if _process_pool is broken_pool:
+        _process_pool = None
+    broken_pool.shutdown(wait=False, cancel_futures=True)
+
+
+class FAQScraper:
+    def __init__(self, website_url: str, max_pages: int = 100, timeout: int = 30000,
+                 concurrency: int = DEFAULT_CONCURRENCY, domain_delay_ms: int = DEFAULT_DOMAIN_DELAY_MS,
+                 use_cache: bool = True):
+        self.base_url = website_url.rstrip("/")
+        self.domain = urlparse(self.base_url).netloc
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.concurrency = concurrency
+        self.domain_delay_ms = domain_delay_ms
+        self.visited_urls: Set[str] = set()
+        self.all_faqs: List[Dict] = []
+        self.seen_hashes: Set[int] = set()
+        self.seen_schema_hashes: Set[int] = set()
+        self.faq_page_found = False
+        
+        # Sync fetches share one pooled session, created on first use and closed after the crawl
+        self._session: Optional[requests.Session] = None
+        
+        # Pages are revalidated with ETag / Last-Modified so unchanged ones come back as 304
+        self._cache = _get_page_cache() if use_cache else None
+
+    def _conditional_headers(self, url: str) -> Tuple[Optional[Dict], Dict[str, str]]:
+        """Return the cached entry for a URL and the conditional request headers for it."""
+        entry = self._cache.get(f"page:{url}") if self._cache is not None else None
+        headers = {}
+        if entry:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return entry, headers
+
+    def _store_page(self, url: str, response_headers, html: str):
+        """Cache a fetched page if the server sent validators for it."""
+        if self._cache is None:
+            return
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if etag or last_modified:
+            self._cache.set(f"page:{url}", {"etag": etag, "last_modified": last_modified, "html": html})
 
-    def _fetch_page_sync(self, url: str) -> Optional[Tuple[BeautifulSoup, str, List[Tuple[str, str]]]]:
+    def _get_session(self) -> requests.Session:
+        """Return the pooled requests session, creating it on first use."""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({'User-Agent': USER_AGENT})
+            adapter = HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=20,
+                max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+            )
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+        return self._session
+
+    def _close_session(self):
+        """Close the pooled requests session if one was opened."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _merge_page(self, page_result: Tuple[List[Dict], List[Tuple[str, str]], Set[int]]) -> List[Tuple[str, str]]:
+        """Merge an extract_page result into the crawl and return the page's unvisited links."""
+        faqs, links, schema_hashes = page_result
+        self.seen_schema_hashes.update(schema_hashes)
+        
+        # Questions are cleaned by the extractor; only cross-page duplicates are left to drop
+        for faq in faqs:
+            question_hash = _question_key(faq["question"].lower())
+            if question_hash not in self.seen_hashes:
+                self.seen_hashes.add(question_hash)
+                self.all_faqs.append(faq)
+        
+        return [(link, text) for link, text in links if link not in self.visited_urls]
+
+    def _process_page(self, html: str, url: str) -> List[Tuple[str, str]]:
+        """Extract a page in this process and merge it into the crawl."""
+        return self._merge_page(
+            extract_page(html, url, self.base_url, self.domain, frozenset(self.seen_schema_hashes))
+        )
+
+    async def _extract_in_pool(self, html: str, url: str) -> Optional[Tuple[List[Dict], List[Tuple[str, str]], Set[int]]]:
+        """Run extract_page on the process pool so parsing uses every core."""
+        args = (html, url, self.base_url, self.domain, frozenset(self.seen_schema_hashes))
+        loop = asyncio.get_running_loop()
+        
+        # A worker died (e.g. OOM-killed); retry once on a fresh pool, never in this process
+        for attempt in range(2):
+            pool = _get_process_pool()
+            try:
+                return await loop.run_in_executor(pool, extract_page, *args)
+            except BrokenProcessPool as e:
+                print(f"Extraction pool broke on {url}, restarting it: {e}")
+                _reset_process_pool(pool)
+        
+        print(f"Skipping {url}: extraction failed twice")
+        return None
+
+    def _fetch_page_sync(self, url: str) -> Optional[str]:
         """Fetch a page using requests (fallback method)."""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=15)
-            if response.status_code >= 400:
-                return None
-            
-            html = response.text
-            soup = BeautifulSoup(html, "html.parser")
+            entry, headers = self._conditional_headers(url)
+            with self._get_session().get(url, headers=headers, timeout=15, stream=True) as response:
+                if response.status_code == 304 and entry:
+                    return entry["html"]
+                if response.status_code >= 400 or not _is_acceptable_page(response.headers):
+                    return None
+                
+                # Stream the body so runaway pages stop at MAX_BODY_BYTES
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=BODY_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) >= MAX_BODY_BYTES:
+                        break
+                encoding = response.encoding
+                response_headers = response.headers
             
-            for element in soup(["script", "style", "noscript", "iframe"]):
-                element.decompose()
+            html = _decode_body(body[:MAX_BODY_BYTES], encoding)
+            self._store_page(url, response_headers, html)
+            return html
             
-            links = self._extract_links_with_text(soup)
+        except Exception as e:
+            print(f"Error fetching {url}: {e}")
+            return None
+
+    async def _fetch_page_aio(self, session: aiohttp.ClientSession, url: str) -> Optional[str]:
+        """Fetch a page using the shared aiohttp session."""
+        try:
+            # The cache is SQLite plus files on disk, so its I/O stays off the event loop
+            loop = asyncio.get_running_loop()
+            entry, headers = await loop.run_in_executor(None, self._conditional_headers, url)
+            async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                if response.status == 304 and entry:
+                    return entry["html"]
+                if response.status >= 400 or not _is_acceptable_page(response.headers):
+                    return None
+                
+                # Stream the body so runaway pages stop at MAX_BODY_BYTES
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) >= MAX_BODY_BYTES:
+                        break
+                encoding = response.charset
+                response_headers = response.headers
             
-            return soup, html, links
+            html = _decode_body(body[:MAX_BODY_BYTES], encoding)
+            await loop.run_in_executor(None, self._store_page, url, response_headers, html)
+            return html
             
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
 
-    async def _fetch_page(self, page, url: str) -> Optional[Tuple[BeautifulSoup, str, List[Tuple[str, str]]]]:
-        """Fetch a page and return soup, html, and links with text."""
+    async def _fetch_page(self, page, url: str) -> Optional[str]:
+        """Fetch a page with the browser and return its rendered html."""
         try:
             response = await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
             if not response or response.status >= 400:
@@ -445,15 +803,7 @@ class FAQScraper:
             except:
                 pass
             
-            html = await page.content()
-            soup = BeautifulSoup(html, "lxml")
-            
-            for element in soup(["script", "style", "noscript", "iframe"]):
-                element.decompose()
-            
-            links = self._extract_links_with_text(soup)
-            
-            return soup, html, links
+            return await page.content()
             
         except Exception as e:
             print(f"Playwright error for {url}, trying requests fallback...")
@@ -461,64 +811,63 @@ class FAQScraper:
 
     def scrape_sync(self) -> Dict:
         """Synchronous scrape method using requests only."""
-        # First, fetch homepage to get all links
-        self.visited_urls.add(self.base_url)
-        print(f"Crawling: {self.base_url}")
-        
-        homepage_result = self._fetch_page_sync(self.base_url)
-        all_links_with_text = []
-        
-        if homepage_result:
-            soup, html, links_with_text = homepage_result
-            all_links_with_text = links_with_text
+        try:
+            # First, fetch homepage to get all links
+            self.visited_urls.add(self.base_url)
+            print(f"Crawling: {self.base_url}")
             
-            # Check if homepage itself has FAQs
-            self._extract_faqs_from_page(soup, html, self.base_url)
-        
-        # Look for FAQ links by URL path OR link text
-        faq_links = [(url, text) for url, text in all_links_with_text if self._is_faq_link(url, text)]
-        
-        if faq_links:
-            # FAQ page found! Crawl only FAQ pages
-            faq_urls = [url for url, _ in faq_links]
-            print(f"FAQ page(s) found: {faq_urls}")
-            for faq_url, _ in faq_links:
-                if faq_url not in self.visited_urls:
-                    self.visited_urls.add(faq_url)
-                    print(f"Crawling FAQ: {faq_url}")
-                    
-                    result = self._fetch_page_sync(faq_url)
-                    if result:
-                        soup, html, _ = result
-                        self._extract_faqs_from_page(soup, html, faq_url)
-                        self.faq_page_found = True
+            homepage_html = self._fetch_page_sync(self.base_url)
+            all_links_with_text = []
             
-            # If we found FAQs from dedicated FAQ pages, we're done
-            if self.all_faqs:
-                print(f"Found {len(self.all_faqs)} FAQs from dedicated FAQ page(s). Stopping crawl.")
-        
-        # If no FAQ page found or no FAQs extracted, crawl all pages
-        if not self.all_faqs:
-            print("No dedicated FAQ page found or no FAQs extracted. Crawling all pages...")
-            to_crawl = [(url, text) for url, text in all_links_with_text if url not in self.visited_urls]
+            if homepage_html:
+                # Check if homepage itself has FAQs
+                all_links_with_text = self._process_page(homepage_html, self.base_url)
+            
+            # Look for FAQ links by URL path OR link text
+            faq_links = [(url, text) for url, text in all_links_with_text if _is_faq_link(url, text)]
             
-            while to_crawl and len(self.visited_urls) < self.max_pages:
-                url, _ = to_crawl.pop(0)
-                if url in self.visited_urls:
-                    continue
+            if faq_links:
+                # FAQ page found! Crawl only FAQ pages
+                faq_urls = [url for url, _ in faq_links]
+                print(f"FAQ page(s) found: {faq_urls}")
+                for faq_url, _ in faq_links:
+                    if faq_url not in self.visited_urls:
+                        self.visited_urls.add(faq_url)
+                        print(f"Crawling FAQ: {faq_url}")
+                        
+                        html = self._fetch_page_sync(faq_url)
+                        if html:
+                            self._process_page(html, faq_url)
+                            self.faq_page_found = True
                 
-                self.visited_urls.add(url)
-                print(f"Crawling: {url}")
+                # If we found FAQs from dedicated FAQ pages, we're done
+                if self.all_faqs:
+                    print(f"Found {len(self.all_faqs)} FAQs from dedicated FAQ page(s). Stopping crawl.")
+            
+            # If no FAQ page found or no FAQs extracted, crawl all pages
+            if not self.all_faqs:
+                print("No dedicated FAQ page found or no FAQs extracted. Crawling all pages...")
+                to_crawl = deque((url, text) for url, text in all_links_with_text if url not in self.visited_urls)
                 
-                result = self._fetch_page_sync(url)
-                if result:
-                    soup, html, links_with_text = result
-                    self._extract_faqs_from_page(soup, html, url)
+                while to_crawl and len(self.visited_urls) < self.max_pages:
+                    url, _ = to_crawl.popleft()
+                    if url in self.visited_urls:
+                        continue
                     
-                    # Add new links
-                    new_links = [(l, t) for l, t in links_with_text if l not in self.visited_urls]
-                    to_crawl.extend(new_links)
-        
+                    self.visited_urls.add(url)
+                    print(f"Crawling: {url}")
+                    
+                    html = self._fetch_page_sync(url)
+                    if html:
+                        # Add new links
+                        to_crawl.extend(self._process_page(html, url))
+            
+            return self._build_result()
+        finally:
+            self._close_session()
+
+    def _build_result(self) -> Dict:
+        """Build the scrape result payload from collected FAQs."""
         return {
             "website": self.base_url,
             "faqs": self.all_faqs,
@@ -531,8 +880,117 @@ class FAQScraper:
         }
 
     async def scrape(self) -> Dict:
-        """Main scrape method - optimized to stop early if FAQ page found."""
+        """Main scrape method - concurrent aiohttp crawl, stops early if FAQ page found."""
+        connector = aiohttp.TCPConnector(limit=self.concurrency, limit_per_host=4, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, headers={'User-Agent': USER_AGENT}) as session:
+            sem = asyncio.Semaphore(self.concurrency)
+            limiter = DomainLimiter(self.domain_delay_ms)
+            
+            async def bounded_fetch(url: str):
+                async with sem:
+                    await limiter.wait(self.domain)
+                    return await self._fetch_page_aio(session, url)
+            
+            async def fetch_and_extract(url: str):
+                html = await bounded_fetch(url)
+                if html is None:
+                    return None
+                return await self._extract_in_pool(html, url)
+            
+            # First, fetch homepage to get all links
+            self.visited_urls.add(self.base_url)
+            print(f"Crawling: {self.base_url}")
+            
+            homepage_html = await bounded_fetch(self.base_url)
+            all_links_with_text = []
+            
+            if homepage_html:
+                # Check if homepage itself has FAQs
+                homepage_result = await self._extract_in_pool(homepage_html, self.base_url)
+                if homepage_result:
+                    all_links_with_text = self._merge_page(homepage_result)
+            
+            # Look for FAQ links by URL path OR link text
+            faq_links = [(url, text) for url, text in all_links_with_text if _is_faq_link(url, text)]
+            
+            if faq_links:
+                # FAQ page found! Crawl only FAQ pages
+                faq_urls = [url for url, _ in faq_links if url not in self.visited_urls]
+                print(f"FAQ page(s) found: {faq_urls}")
+                for faq_url in faq_urls:
+                    self.visited_urls.add(faq_url)
+                    print(f"Crawling FAQ: {faq_url}")
+                
+                results = await asyncio.gather(*[fetch_and_extract(faq_url) for faq_url in faq_urls])
+                for result in results:
+                    if result:
+                        self._merge_page(result)
+                        self.faq_page_found = True
+                
+                # If we found FAQs from dedicated FAQ pages, we're done
+                if self.all_faqs:
+                    print(f"Found {len(self.all_faqs)} FAQs from dedicated FAQ page(s). Stopping crawl.")
+            
+            # If no FAQ page found or no FAQs extracted, crawl all pages
+            if not self.all_faqs:
+                print("No dedicated FAQ page found or no FAQs extracted. Crawling all pages...")
+                to_crawl: asyncio.Queue = asyncio.Queue()
+                for url, _ in all_links_with_text:
+                    if url not in self.visited_urls:
+                        to_crawl.put_nowait(url)
+                
+                while not to_crawl.empty() and len(self.visited_urls) < self.max_pages:
+                    # Drain the current frontier into one batch of parallel fetches
+                    batch = []
+                    while not to_crawl.empty() and len(self.visited_urls) < self.max_pages:
+                        url = to_crawl.get_nowait()
+                        if url in self.visited_urls:
+                            continue
+                        self.visited_urls.add(url)
+                        print(f"Crawling: {url}")
+                        batch.append(url)
+                    
+                    results = await asyncio.gather(*[fetch_and_extract(url) for url in batch])
+                    
+                    # Results are merged here, in order, so shared state needs no locking
+                    for result in results:
+                        if result:
+                            # Add new links
+                            for link, _ in self._merge_page(result):
+                                to_crawl.put_nowait(link)
+        
+        # Only boot a browser when static HTML yielded nothing and the site renders client-side
+        if not self.all_faqs and self._is_js_rendered(homepage_html):
+            print("No FAQs in static HTML and site looks JS-rendered, falling back to Playwright...")
+            try:
+                return await self._scrape_playwright()
+            finally:
+                # The browser crawl falls back to the requests session for pages it can't load
+                self._close_session()
+        
+        return self._build_result()
+
+    def _is_js_rendered(self, homepage_html: Optional[str]) -> bool:
+        """Check if the homepage is a client-side rendered shell that needs a browser."""
+        if not homepage_html:
+            return True
+        if JS_APP_RE.search(homepage_html):
+            return True
+        tree = LexborHTMLParser(homepage_html)
+        for element in tree.css(INVISIBLE_SELECTOR):
+            element.decompose()
+        return len(tree.text(strip=True)) < MIN_STATIC_TEXT_LENGTH
+
+    async def _scrape_playwright(self) -> Dict:
+        """Scrape with a headless browser, for sites that render content with JavaScript.
+
+        Playwright is optional and not in requirements.txt; the fallback needs
+        `pip install playwright && playwright install chromium`. Without it the
+        static crawl's result is returned as is.
+        """
         try:
+            from playwright.async_api import async_playwright
+            
             async with async_playwright() as p:
                 browser = await p.chromium.launch(
                     headless=True,
@@ -544,7 +1002,7 @@ class FAQScraper:
                     ]
                 )
                 context = await browser.new_context(
-                    user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+                    user_agent=USER_AGENT,
                     viewport={'width': 1920, 'height': 1080}
                 )
                 context.set_default_timeout(self.timeout)
@@ -552,22 +1010,22 @@ class FAQScraper:
                 # Use a single page for all requests to avoid browser crashes
                 page = await context.new_page()
                 
+                # The browser is up, so re-crawl from the homepage
+                self.visited_urls.clear()
+                
                 # First, fetch homepage to get all links
                 self.visited_urls.add(self.base_url)
                 print(f"Crawling: {self.base_url}")
                 
-                homepage_result = await self._fetch_page(page, self.base_url)
+                homepage_html = await self._fetch_page(page, self.base_url)
                 all_links_with_text = []
                 
-                if homepage_result:
-                    soup, html, links_with_text = homepage_result
-                    all_links_with_text = links_with_text
-                    
+                if homepage_html:
                     # Check if homepage itself has FAQs
-                    self._extract_faqs_from_page(soup, html, self.base_url)
+                    all_links_with_text = self._process_page(homepage_html, self.base_url)
                 
                 # Look for FAQ links by URL path OR link text
-                faq_links = [(url, text) for url, text in all_links_with_text if self._is_faq_link(url, text)]
+                faq_links = [(url, text) for url, text in all_links_with_text if _is_faq_link(url, text)]
                 
                 if faq_links:
                     # FAQ page found! Crawl only FAQ pages
@@ -578,10 +1036,9 @@ class FAQScraper:
                             self.visited_urls.add(faq_url)
                             print(f"Crawling FAQ: {faq_url}")
                             
-                            result = await self._fetch_page(page, faq_url)
-                            if result:
-                                soup, html, _ = result
-                                self._extract_faqs_from_page(soup, html, faq_url)
+                            html = await self._fetch_page(page, faq_url)
+                            if html:
+                                self._process_page(html, faq_url)
                                 self.faq_page_found = True
                     
                     # If we found FAQs from dedicated FAQ pages, we're done
@@ -591,24 +1048,20 @@ class FAQScraper:
                 # If no FAQ page found or no FAQs extracted, crawl all pages
                 if not self.all_faqs:
                     print("No dedicated FAQ page found or no FAQs extracted. Crawling all pages...")
-                    to_crawl = [(url, text) for url, text in all_links_with_text if url not in self.visited_urls]
+                    to_crawl = deque((url, text) for url, text in all_links_with_text if url not in self.visited_urls)
                     
                     while to_crawl and len(self.visited_urls) < self.max_pages:
-                        url, _ = to_crawl.pop(0)
+                        url, _ = to_crawl.popleft()
                         if url in self.visited_urls:
                             continue
                         
                         self.visited_urls.add(url)
                         print(f"Crawling: {url}")
                         
-                        result = await self._fetch_page(page, url)
-                        if result:
-                            soup, html, links_with_text = result
-                            self._extract_faqs_from_page(soup, html, url)
-                            
+                        html = await self._fetch_page(page, url)
+                        if html:
                             # Add new links
-                            new_links = [(l, t) for l, t in links_with_text if l not in self.visited_urls]
-                            to_crawl.extend(new_links)
+                            to_crawl.extend(self._process_page(html, url))
                 
                 try:
                     await page.close()
@@ -623,25 +1076,16 @@ class FAQScraper:
                 except:
                     pass
         except Exception as e:
-            print(f"Playwright failed, falling back to requests: {e}")
-            return self.scrape_sync()
+            # The static crawl already fetched every page it could; don't crawl the site again
+            print(f"Playwright unavailable or failed, returning static results: {e}")
         
-        return {
-            "website": self.base_url,
-            "faqs": self.all_faqs,
-            "metadata": {
-                "pagesProcessed": len(self.visited_urls),
-                "totalFaqsFound": len(self.all_faqs),
-                "faqPageFound": self.faq_page_found,
-                "extractedAt": datetime.now(timezone.utc).isoformat()
-            }
-        }
+        return self._build_result()
 
 
 def run_scraper(url: str, max_pages: int = 50) -> Dict:
-    """Run the scraper using requests (more reliable)."""
+    """Run the scraper using the concurrent aiohttp crawler."""
     scraper = FAQScraper(website_url=url, max_pages=max_pages)
-    return scraper.scrape_sync()
+    return asyncio.run(scraper.scrape())
 
 
 @app.route('/')
@@ -663,7 +1107,8 @@ def scrape():
     
     try:
         result = run_scraper(url, max_pages)
-        return jsonify(result)
+        # Serialize straight to bytes; FAQ lists from large crawls can be big
+        return app.response_class(orjson.dumps(result), mimetype='application/json')
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -0,0 +1 @@
+# Lets pytest import app from the repo root without installing it.
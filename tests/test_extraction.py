@@ -0,0 +1,66 @@
+from app import extract_page
+
+BASE_URL = 'http://example.com'
+
+
+def _questions(html: str):
+    faqs, _, _ = extract_page(html, BASE_URL + '/faq', BASE_URL, 'example.com')
+    return [faq['question'] for faq in faqs]
+
+
+def test_nested_accordion_header_is_kept():
+    html = '''<html><body>
+    <header><nav><a href="/faq">FAQ</a></nav></header>
+    <main>
+      <h2>Frequently Asked Questions</h2>
+      <section class="faq">
+        <div class="faq-item">
+          <header class="faq-question"><h3>How do I reset my password?</h3></header>
+          <div class="faq-answer"><p>Use the forgot password link on the login page to reset it.</p></div>
+        </div>
+      </section>
+    </main>
+    </body></html>'''
+    assert _questions(html) == ['How do I reset my password?']
+
+
+def test_page_footer_is_pruned_but_its_links_are_kept():
+    html = '''<html><body>
+    <main><p>Welcome to our store.</p></main>
+    <footer>
+      <h2>FAQ</h2>
+      <p>How do I contact support?</p>
+      <p>Email us at help@example.com any time of day.</p>
+      <a href="/help">Help Center</a>
+    </footer>
+    </body></html>'''
+    faqs, links, _ = extract_page(html, BASE_URL + '/', BASE_URL, 'example.com')
+    assert faqs == []
+    assert (BASE_URL + '/help', 'help center') in links
+
+
+SCHEMA_PAGE = '''<html><head>
+<script type="application/ld+json">
+{"@context": "https://schema.org", "@type": "FAQPage", "mainEntity": [
+  {"@type": "Question", "name": "Do you ship internationally?",
+   "acceptedAnswer": {"@type": "Answer", "text": "Yes, we ship to over 50 countries."}}
+]}
+</script>
+</head><body><main><p>Welcome to our store.</p></main></body></html>'''
+
+
+def test_json_ld_faq_page_is_extracted():
+    faqs, _, schema_hashes = extract_page(SCHEMA_PAGE, BASE_URL + '/', BASE_URL, 'example.com')
+    assert [(faq['question'], faq['answer']) for faq in faqs] == [
+        ('Do you ship internationally?', 'Yes, we ship to over 50 countries.')
+    ]
+    assert len(schema_hashes) == 1
+
+
+def test_seen_json_ld_block_is_skipped():
+    _, _, schema_hashes = extract_page(SCHEMA_PAGE, BASE_URL + '/', BASE_URL, 'example.com')
+    faqs, _, new_hashes = extract_page(
+        SCHEMA_PAGE, BASE_URL + '/other', BASE_URL, 'example.com', frozenset(schema_hashes)
+    )
+    assert faqs == []
+    assert new_hashes == set()